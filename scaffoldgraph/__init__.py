@@ -11,7 +11,10 @@ from . import vis
 from .core import (
     get_next_murcko_fragments,
     get_all_murcko_fragments,
+    get_all_murcko_fragments_batch,
+    get_all_murcko_fragments_threaded,
     get_murcko_scaffold,
+    get_murcko_scaffold_from_smiles,
     get_ring_toplogy_scaffold,
     get_ring_connectivity_scaffold,
 )
@@ -30,7 +33,10 @@ __all__ = [
     'tree_frags_from_mol',
     'get_next_murcko_fragments',
     'get_all_murcko_fragments',
+    'get_all_murcko_fragments_batch',
+    'get_all_murcko_fragments_threaded',
     'get_murcko_scaffold',
+    'get_murcko_scaffold_from_smiles',
     'get_ring_toplogy_scaffold',
     'get_ring_connectivity_scaffold',
 ]
@@ -8,8 +8,11 @@ from .fragment import (
     MurckoRingFragmenter,
     MurckoRingSystemFragmenter,
     get_all_murcko_fragments,
+    get_all_murcko_fragments_batch,
+    get_all_murcko_fragments_threaded,
     get_next_murcko_fragments,
     get_murcko_scaffold,
+    get_murcko_scaffold_from_smiles,
     get_ring_toplogy_scaffold,
     get_ring_connectivity_scaffold
 )
@@ -23,8 +26,11 @@ __all__ = [
     'MurckoRingFragmenter',
     'MurckoRingSystemFragmenter',
     'get_all_murcko_fragments',
+    'get_all_murcko_fragments_batch',
+    'get_all_murcko_fragments_threaded',
     'get_next_murcko_fragments',
     'get_murcko_scaffold',
+    'get_murcko_scaffold_from_smiles',
     'get_ring_toplogy_scaffold',
     'get_ring_connectivity_scaffold',
 ]
@@ -2,7 +2,11 @@
 scaffoldgraph.core.fragment
 """
 
+import sys
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
 
 from loguru import logger
 
@@ -11,6 +15,7 @@ from rdkit.Chem import (
     Atom,
     RWMol,
     MolToSmiles,
+    MolFromSmiles,
     rdmolops,
     SanitizeMol,
     GetMolFrags,
@@ -30,6 +35,20 @@ from rdkit.Chem import (
 from scaffoldgraph.core.scaffold import Scaffold
 from scaffoldgraph.utils import suppress_rdlogger
 
+# Enum values used inside fragmentation loops.
+_BOND_DOUBLE = BondType.DOUBLE
+
+# Batch editing of RWMols is only available in newer versions of rdkit.
+_HAS_BATCH_EDIT = hasattr(RWMol, 'BeginBatchEdit')
+
+# Sanitization operations performed by partial_sanitization.
+_PARTIAL_SANITIZATION_OPS = (
+    SANITIZE_ALL ^
+    SANITIZE_CLEANUP ^
+    SANITIZE_CLEANUPCHIRALITY ^
+    SANITIZE_FINDRADICALS
+)
+
 
 class Fragmenter(ABC):
     """Abstract base class for scaffold fragmentation methods.
@@ -142,51 +161,66 @@ class MurckoRingFragmenter(Fragmenter):
         """
         parents = []  # container for parent scaffolds
         rings = scaffold.rings  # ring information
+        atom_ring_counts = rings.atom_ring_counts
+        bond_ring_counts = rings.bond_ring_counts
+        atoms = scaffold.atoms
+        num_parent_rings = len(rings) - 1  # ring count of a valid parent
 
         for rix, ring in enumerate(rings):  # Loop through all rings and remove
-            edit = RWMol(scaffold.mol)  # Editable molecule
+            edit = RWMol(scaffold.mol, True)  # Editable molecule (quick copy)
+
+            # Ring atoms whose properties have already been corrected
+            corrected = bytearray(len(atoms))
 
             # Collect all removable atoms in the molecule
             remove_atoms = set()
-            for index, atom in zip(ring.aix, ring.atoms):
-                if rings.info.NumAtomRings(index) == 1:
-                    if atom.GetDegree() > 2:  # Evoke linker collection
+            for index in ring.aix:
+                if atom_ring_counts[index] == 1:
+                    if atoms[index].GetDegree() > 2:  # Evoke linker collection
                         collect_linker_atoms(edit.GetAtomWithIdx(index), remove_atoms)
                     else:  # Add ring atom to removable set
                         remove_atoms.add(index)
                 else:  # Atom is shared between multiple rings
                     correct_atom_props(edit.GetAtomWithIdx(index))
+                    corrected[index] = 1
 
             # Collect removable bonds (this needs to be done to prevent the case where when deleting
             # a ring two atoms belonging to the same bond are also part of separate other rings.
             # This bond must be broken to prevent an incorrect output)
-            remove_bonds = set()
-            for bix in {x for x in ring.bix if rings.info.NumBondRings(x) == 1}:
+            remove_bonds = []
+            for bix in ring.bix:
+                if bond_ring_counts[bix] != 1:
+                    continue
                 bond = edit.GetBondWithIdx(bix)
                 b_x, b_y = bond.GetBeginAtomIdx(), bond.GetEndAtomIdx()
                 if b_x not in remove_atoms and b_y not in remove_atoms:
-                    remove_bonds.add((b_x, b_y))
-                    correct_atom_props(edit.GetAtomWithIdx(b_x))
-                    correct_atom_props(edit.GetAtomWithIdx(b_y))
+                    remove_bonds.append((b_x, b_y))
+                    for b_idx in (b_x, b_y):
+                        if not corrected[b_idx]:
+                            correct_atom_props(edit.GetAtomWithIdx(b_idx))
+                            corrected[b_idx] = 1
 
             # Scheme 4 (scaffold tree rule)
             if self.use_scheme_4 is not False and len(ring) == 3:
-                atomic_nums = [a.GetAtomicNum() for a in ring.atoms]
-                if len([a for a in atomic_nums if a != 1 and a != 6]) == 1:
-                    shared = {x for x in ring.bix if rings.info.NumBondRings(x) > 1}
+                heteroatoms = 0  # stop counting once more than one is found
+                for index in ring.aix:
+                    atomic_num = atoms[index].GetAtomicNum()
+                    if atomic_num != 1 and atomic_num != 6:
+                        heteroatoms += 1
+                        if heteroatoms > 1:
+                            break
+                if heteroatoms == 1:
+                    shared = [x for x in ring.bix if bond_ring_counts[x] > 1]
                     if len(shared) == 1:
-                        bond = edit.GetBondWithIdx(shared.pop())
-                        bond.SetBondType(BondType.DOUBLE)
+                        bond = edit.GetBondWithIdx(shared[0])
+                        bond.SetBondType(_BOND_DOUBLE)
 
             # Remove collected atoms and bonds
-            for bix in remove_bonds:
-                edit.RemoveBond(*bix)
-            for aix in sorted(remove_atoms, reverse=True):
-                edit.RemoveAtom(aix)
+            remove_atoms_and_bonds(edit, remove_atoms, remove_bonds)
 
             # Add new parent scaffolds to parent list
             for parent in get_scaffold_frags(edit):
-                if parent.rings.count == len(rings) - 1:
+                if parent.rings.count == num_parent_rings:
                     parent.removed_ring_idx = rix
                     parents.append(parent)
 
@@ -232,15 +266,18 @@ class MurckoRingSystemFragmenter(Fragmenter):
         """
         parents = []
         rings = scaffold.ring_systems  # ring system information
-        info = scaffold.rings.info
+        atom_ring_counts = scaffold.rings.atom_ring_counts
+        atoms = scaffold.atoms
 
         if rings.count == 1:
             return []
+        num_parent_systems = len(rings) - 1  # ring system count of a valid parent
         for rix, ring in enumerate(rings):
-            edit = RWMol(scaffold.mol)
+            edit = RWMol(scaffold.mol, True)
             remove_atoms = set()
-            for index, atom in zip(ring.aix, ring.atoms):
-                if info.NumAtomRings(index) == 1 or any([not b.IsInRing() for b in atom.GetBonds()]):
+            for index in ring.aix:
+                atom = atoms[index]
+                if atom_ring_counts[index] == 1 or any([not b.IsInRing() for b in atom.GetBonds()]):
                     if atom.GetDegree() > 2:  # Evoke linker collection
                         collect_linker_atoms(edit.GetAtomWithIdx(index), remove_atoms)
                     else:
@@ -248,11 +285,10 @@ class MurckoRingSystemFragmenter(Fragmenter):
                 else:
                     remove_atoms.add(index)
 
-            for aix in sorted(remove_atoms, reverse=True):
-                edit.RemoveAtom(aix)
+            remove_atoms_and_bonds(edit, remove_atoms)
 
             for parent in get_scaffold_frags(edit):
-                if parent.ring_systems.count == len(rings) - 1:
+                if parent.ring_systems.count == num_parent_systems:
                     parent.removed_ring_idx = rix
                     parents.append(parent)
 
@@ -285,55 +321,66 @@ def collect_linker_atoms(origin, remove_atoms, include_origin=True):
         `remove_atoms` set that is supplied.
 
     """
-    visited = set()  # Visited bond indexes
+    visited = bytearray(origin.GetOwningMol().GetNumBonds())  # Visited bond mask
     ring_attachments = set()  # Linker ring attachments
+    bond_double = _BOND_DOUBLE
 
-    def collect(origin_atom):
+    # The linker is collected with a depth-first traversal using an
+    # explicit stack of (atom, atom index, bond iterator) entries. An
+    # atom's remaining bonds are resumed once its branch is exhausted.
+    # Linker atoms are added to the existing set 'remove_atoms'
+    stack = [(origin, origin.GetIdx(), iter(origin.GetBonds()))]
+    while stack:
+        origin_atom, origin_idx, bonds = stack[-1]
 
-        for bond in origin_atom.GetBonds():
+        for bond in bonds:
             bond_id = bond.GetIdx()
-            if bond_id in visited or bond.IsInRing():
+            if visited[bond_id] or bond.IsInRing():
                 continue
 
             other_atom = bond.GetOtherAtom(origin_atom)
             other_degree = other_atom.GetDegree()
 
             if other_degree == 1:  # Terminal side-chain
-                remove_atoms.add(origin_atom.GetIdx())
+                remove_atoms.add(origin_idx)
                 remove_atoms.add(other_atom.GetIdx())
                 correct_atom_props(origin_atom)
-                visited.add(bond_id)
+                visited[bond_id] = 1
 
             elif other_degree == 2:  # Two neighboring atoms (remove)
-                remove_atoms.add(origin_atom.GetIdx())
-                visited.add(bond_id)
-                collect(other_atom)
+                remove_atoms.add(origin_idx)
+                visited[bond_id] = 1
+                stack.append((other_atom, other_atom.GetIdx(), iter(other_atom.GetBonds())))
+                break
 
             elif other_degree > 2:  # Branching point
 
                 # Determine number of non-terminal branches
+                # (stop counting once the linker is known to branch)
                 non_terminal_branches = 0
                 for neighbor in other_atom.GetNeighbors():
                     if neighbor.GetDegree() != 1:
                         non_terminal_branches += 1
+                        if non_terminal_branches == 3:
+                            break
 
                 if non_terminal_branches < 3:  # Continue with deletion
-                    remove_atoms.add(origin_atom.GetIdx())
-                    visited.add(bond_id)
-                    collect(other_atom)
+                    remove_atoms.add(origin_idx)
+                    visited[bond_id] = 1
+                    stack.append((other_atom, other_atom.GetIdx(), iter(other_atom.GetBonds())))
+                    break
 
                 else:  # Branching point links two rings
                     # Test for exolinker double bond
-                    if not bond.GetBondType() == BondType.DOUBLE:
-                        remove_atoms.add(origin_atom.GetIdx())
+                    if not bond.GetBondType() == bond_double:
+                        remove_atoms.add(origin_idx)
                         correct_atom_props(other_atom)
-                        visited.add(bond_id)
+                        visited[bond_id] = 1
                     if other_atom.IsInRing():
                         ring_attachments.add(other_atom.GetIdx())
 
-    # Linker is recursively collected
-    # Linker atoms are added to the existing set 'remove_atoms'
-    collect(origin)
+        else:  # All bonds of this atom have been processed
+            stack.pop()
 
     if include_origin is False:
         remove_atoms.discard(origin.GetIdx())
@@ -343,6 +390,39 @@ def collect_linker_atoms(origin, remove_atoms, include_origin=True):
     return ring_attachments
 
 
+def remove_atoms_and_bonds(edit, remove_atoms, remove_bonds=()):
+    """Remove a collection of atoms and bonds from an editable molecule.
+
+    When supported by the installed version of rdkit the removals are
+    performed as a single batch edit, so that the molecule is only
+    re-indexed once. Otherwise atoms are removed one at a time in
+    descending index order.
+
+    Parameters
+    ----------
+    edit : rdkit.Chem.rdchem.RWMol
+        Molecule to edit in-place.
+    remove_atoms : iterable
+        Indexes of atoms to remove.
+    remove_bonds : iterable, optional
+        Tuples of (begin, end) atom indexes for bonds to remove.
+        The default is an empty tuple.
+
+    """
+    if _HAS_BATCH_EDIT:
+        edit.BeginBatchEdit()
+        for bix in remove_bonds:
+            edit.RemoveBond(*bix)
+        for aix in remove_atoms:
+            edit.RemoveAtom(aix)
+        edit.CommitBatchEdit()
+    else:
+        for bix in remove_bonds:
+            edit.RemoveBond(*bix)
+        for aix in sorted(remove_atoms, reverse=True):
+            edit.RemoveAtom(aix)
+
+
 def get_scaffold_frags(frag, hash_func=None):
     """Get fragments from a disconnected structure.
 
@@ -385,8 +465,16 @@ def get_scaffold_frags(frag, hash_func=None):
         # equivalent to the behavior of SNG (I believe...)
         logger.debug(e)
         return set()
-    frags = {Scaffold(f, hash_func) for f in GetMolFrags(frag, True, False)}
-    return frags
+    # A connected structure needs no fragment extraction (avoids a copy).
+    if len(GetMolFrags(frag)) == 1:
+        return {Scaffold(frag, hash_func)}
+    # Deduplicate fragments on their canonical identifier (string
+    # comparison) rather than through Scaffold equality.
+    frags = {}
+    for f in GetMolFrags(frag, True, False):
+        scaffold = Scaffold(f, hash_func)
+        frags.setdefault(scaffold.get_canonical_identifier(), scaffold)
+    return set(frags.values())
 
 
 def correct_atom_props(atom):
@@ -399,13 +487,21 @@ def correct_atom_props(atom):
     atom : rdkit.Chem.rdchem.Atom
         Atom to correct.
 
+    Notes
+    -----
+    The atom is left untouched unless it is an aromatic heteroatom,
+    has the `NoImplicit` flag set or has a chiral tag, which is the
+    common case for carbon-only scaffolds.
+
     """
     if atom.GetIsAromatic() and atom.GetAtomicNum() != 6:
         atom.SetNumExplicitHs(1)
-    elif atom.GetNoImplicit() or atom.GetChiralTag() != CHI_UNSPECIFIED:
-        atom.SetNoImplicit(False)
-        atom.SetNumExplicitHs(0)
-        atom.SetChiralTag(CHI_UNSPECIFIED)
+        return
+    if not atom.GetNoImplicit() and atom.GetChiralTag() == CHI_UNSPECIFIED:
+        return
+    atom.SetNoImplicit(False)
+    atom.SetNumExplicitHs(0)
+    atom.SetChiralTag(CHI_UNSPECIFIED)
 
 
 def partial_sanitization(mol):
@@ -417,12 +513,7 @@ def partial_sanitization(mol):
         Molecule to sanitize.
 
     """
-    SanitizeMol(
-        mol, sanitizeOps=SANITIZE_ALL ^
-        SANITIZE_CLEANUP ^
-        SANITIZE_CLEANUPCHIRALITY ^
-        SANITIZE_FINDRADICALS
-    )
+    SanitizeMol(mol, sanitizeOps=_PARTIAL_SANITIZATION_OPS)
 
 
 def flatten_isotopes(mol):
@@ -690,6 +781,47 @@ def get_murcko_scaffold(mol, generic=False, remove_exocyclic=False, collapse_lin
     return murcko
 
 
+@lru_cache(maxsize=100000)
+def _cached_murcko_scaffold(smiles, generic):
+    """Private: LRU cached murcko scaffold computed from a SMILES string."""
+    mol = MolFromSmiles(smiles)
+    if mol is None:
+        return None
+    return get_murcko_scaffold(mol, generic=generic)
+
+
+def get_murcko_scaffold_from_smiles(smiles, generic=False):
+    """Get the murcko scaffold for a molecule supplied as a SMILES string.
+
+    Results are held in an LRU cache keyed on the SMILES string, so
+    repeated requests for the same molecule (common in large datasets)
+    only compute the scaffold once.
+
+    Parameters
+    ----------
+    smiles : str
+        SMILES string of the input molecule.
+    generic : bool, optional
+        If True return a generic scaffold (CSK).
+        The default is False.
+
+    Returns
+    -------
+    murcko : rdkit.Chem.rdchem.Mol, None
+        A copy of the cached Murcko scaffold, which may be modified
+        freely. None is returned if the SMILES cannot be parsed.
+
+    See Also
+    --------
+    get_murcko_scaffold
+
+    """
+    murcko = _cached_murcko_scaffold(smiles, generic)
+    if murcko is None:
+        return None
+    return Mol(murcko)
+
+
 def get_annotated_murcko_scaffold(mol, scaffold=None, as_mol=True):
     """
     Return an annotated murcko scaffold where side chains are replaced
@@ -756,7 +888,7 @@ def get_next_murcko_fragments(murcko_scaffold, break_fused_rings=True):
 def get_all_murcko_fragments(mol, break_fused_rings=True):
     """
     Get all possible murcko fragments from a molecule through
-    recursive removal of peripheral rings.
+    iterative removal of peripheral rings.
 
     Parameters
     ----------
@@ -778,25 +910,188 @@ def get_all_murcko_fragments(mol, break_fused_rings=True):
     >>> molecule = Chem.MolFromSmiles(smiles)
     >>> frags = get_all_murcko_fragments(molecule)
 
+    """
+    return _get_all_murcko_fragments(get_murcko_scaffold(mol), break_fused_rings)
+
+
+def _get_all_murcko_fragments(murcko, break_fused_rings=True):
+    """Private: get all possible murcko fragments from a murcko scaffold.
+
+    Parameters
+    ----------
+    murcko : rdkit.Chem.rdchem.Mol
+        Murcko scaffold to fragment. Stereochemistry is removed
+        from the scaffold in-place.
+    break_fused_rings : bool, optional
+        If True dissect fused rings. The default is True.
+
+    Returns
+    -------
+    list
+        A list of Murcko fragments for the scaffold.
+
     """
     if break_fused_rings:
         fragmenter = MurckoRingFragmenter()
     else:
         fragmenter = MurckoRingSystemFragmenter()
-    mol = get_murcko_scaffold(mol)
-    rdmolops.RemoveStereochemistry(mol)
-    scaffold = Scaffold(mol)
-    parents = {scaffold}
-
-    def recursive_generation(child):
+    rdmolops.RemoveStereochemistry(murcko)
+    scaffold = Scaffold(murcko)
+
+    # Scaffolds are keyed by their canonical identifier so that each
+    # unique scaffold is only fragmented once, even when it is reached
+    # through different ring removal orders.
+    parents = {scaffold.get_canonical_identifier(): scaffold}
+
+    # Breadth-first traversal of the fragment hierarchy.
+    queue = deque([scaffold])
+    while queue:
+        child = queue.popleft()
         for parent in fragmenter.fragment(child):
-            if parent in parents:
+            key = parent.get_canonical_identifier()
+            if key in parents:
                 continue
-            parents.add(parent)
-            recursive_generation(parent)
+            parents[key] = parent
+            queue.append(parent)
 
-    recursive_generation(scaffold)
-    return [f.mol for f in parents]
+    return [f.mol for f in parents.values()]
+
+
+@suppress_rdlogger()
+def _murcko_fragments_from_smiles(smiles, break_fused_rings=True):
+    """Private: worker for ``get_all_murcko_fragments_batch``.
+
+    Molecules are passed to and from worker processes as SMILES
+    strings, as these are much cheaper to pickle than rdkit Mols.
+
+    Parameters
+    ----------
+    smiles : str, None
+        SMILES string of the molecule to fragment.
+    break_fused_rings : bool, optional
+        If True dissect fused rings. The default is True.
+
+    Returns
+    -------
+    list
+        SMILES strings of the Murcko fragments for the molecule.
+        An empty list is returned if the SMILES cannot be parsed.
+
+    """
+    murcko = get_murcko_scaffold_from_smiles(smiles) if smiles is not None else None
+    if murcko is None:
+        return []
+    frags = _get_all_murcko_fragments(murcko, break_fused_rings)
+    return [MolToSmiles(f) for f in frags]
+
+
+def get_all_murcko_fragments_batch(mols, break_fused_rings=True, n_workers=None, chunksize=256):
+    """
+    Get all possible murcko fragments for a collection of molecules
+    using a pool of worker processes.
+
+    Each molecule is fragmented independently (see
+    ``get_all_murcko_fragments``), which allows large datasets to be
+    distributed across multiple cores.
+
+    Parameters
+    ----------
+    mols : iterable
+        An iterable of rdkit Mols. None values are allowed and yield
+        no fragments.
+    break_fused_rings : bool, optional
+        If True dissect fused rings. The default is True.
+    n_workers : int, optional
+        Number of worker processes. If None the number of processors
+        on the machine is used. The default is None.
+    chunksize : int, optional
+        Number of molecules submitted to a worker process at a time.
+        The default is 256.
+
+    Returns
+    -------
+    list
+        A list containing a list of Murcko fragments for each input
+        molecule, in the order they were supplied.
+
+    Examples
+    --------
+    Generating Murcko fragments for multiple molecules:
+
+    >>> from rdkit import Chem
+    >>> smiles = ['Cc1[nH]cnc1Cn1cccc(-c2ccccc2O)c1=O', 'c1ccc(Cc2ccccc2)cc1']
+    >>> molecules = [Chem.MolFromSmiles(s) for s in smiles]
+    >>> frags = get_all_murcko_fragments_batch(molecules, n_workers=2)
+
+    """
+    smiles = [MolToSmiles(m) if m is not None else None for m in mols]
+    worker = partial(_murcko_fragments_from_smiles, break_fused_rings=break_fused_rings)
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        results = executor.map(worker, smiles, chunksize=chunksize)
+        return [[MolFromSmiles(f) for f in frags] for frags in results]
+
+
+def _is_gil_enabled():
+    """bool : Private: Returns False only on a free-threaded interpreter without the GIL."""
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    if is_gil_enabled is None:  # python < 3.13
+        return True
+    return is_gil_enabled()
+
+
+def _murcko_fragments_from_mol(mol, break_fused_rings=True):
+    """Private: worker for ``get_all_murcko_fragments_threaded``.
+
+    The rdkit logger is not suppressed here as toggling its global
+    state from multiple threads is not safe. It is instead suppressed
+    once by the calling function.
+
+    """
+    if mol is None:
+        return []
+    return _get_all_murcko_fragments(get_murcko_scaffold(mol), break_fused_rings)
+
+
+@suppress_rdlogger()
+def get_all_murcko_fragments_threaded(mols, break_fused_rings=True, n_threads=None):
+    """
+    Get all possible murcko fragments for a collection of molecules
+    using a pool of threads.
+
+    Threads only run in parallel on a free-threaded (PEP 703) build of
+    python with the GIL disabled. In this case molecules are shared
+    with the threads directly, avoiding the pickling and memory costs
+    of a process pool. When the GIL is enabled this function falls back
+    to ``get_all_murcko_fragments_batch``.
+
+    Parameters
+    ----------
+    mols : iterable
+        An iterable of rdkit Mols. None values are allowed and yield
+        no fragments.
+    break_fused_rings : bool, optional
+        If True dissect fused rings. The default is True.
+    n_threads : int, optional
+        Number of threads (or worker processes when falling back to
+        the process pool). If None the default of the underlying
+        executor is used. The default is None.
+
+    Returns
+    -------
+    list
+        A list containing a list of Murcko fragments for each input
+        molecule, in the order they were supplied.
+
+    See Also
+    --------
+    get_all_murcko_fragments_batch
+
+    """
+    if _is_gil_enabled():
+        return get_all_murcko_fragments_batch(mols, break_fused_rings, n_workers=n_threads)
+    worker = partial(_murcko_fragments_from_mol, break_fused_rings=break_fused_rings)
+    with ThreadPoolExecutor(max_workers=n_threads) as executor:
+        return list(executor.map(worker, mols))
 
 
 def _minimize_rings(mol):
@@ -92,7 +92,8 @@ class Scaffold(object):
         '_rings',
         '_ring_systems',
         '_smiles',
-        'hash_func',
+        '_hash_func',
+        '_identifier',
         '__weakref__',
     )
 
@@ -168,6 +169,17 @@ class Scaffold(object):
             self._ring_systems = RingSystemStack(self)
         return self._ring_systems
 
+    @property
+    def hash_func(self):
+        """callable : Returns the hash function used for the canonical identifier."""
+        return self._hash_func
+
+    @hash_func.setter
+    def hash_func(self, value):
+        """Set the hash function, clearing the cached canonical identifier."""
+        self._hash_func = value
+        self._identifier = None
+
     @property
     def smiles(self):
         """str : Returns the canonical smiles string of the scaffold."""
@@ -206,7 +218,9 @@ class Scaffold(object):
 
         The canonical identifier is determined by the internal
         `hash_func` attribute. This can be set upon initialization
-        or afterwards by: Scaffold.hash_func = callable.
+        or afterwards by: Scaffold.hash_func = callable. The
+        identifier is computed once and cached until the `hash_func`
+        is changed.
 
         Returns
         -------
@@ -214,9 +228,12 @@ class Scaffold(object):
             A canonical identifier for the scaffold.
 
         """
-        if self.hash_func:
-            return self.hash_func(self.mol)
-        return self.smiles
+        if self._identifier is None:
+            if self._hash_func:
+                self._identifier = self._hash_func(self.mol)
+            else:
+                self._identifier = self.smiles
+        return self._identifier
 
     def clear_cached_attributes(self):
         """Clear all cached attributes."""
@@ -272,7 +289,8 @@ class Scaffold(object):
         if isinstance(other, str):
             return self.get_canonical_identifier() == other
         return (
-            type(self) == type(other) and hash(self), hash(other)
+            type(self) == type(other) and
+            self.get_canonical_identifier() == other.get_canonical_identifier()
         )
 
     def __str__(self):
@@ -324,6 +342,8 @@ class RingStack(object):
         'info',
         'atom_rings',
         'bond_rings',
+        '_atom_ring_counts',
+        '_bond_ring_counts',
     )
 
     def __init__(self, owner):
@@ -331,6 +351,8 @@ class RingStack(object):
         self.info = self._initialize_ring_info()
         self.atom_rings = self.info.AtomRings()
         self.bond_rings = self.info.BondRings()
+        self._atom_ring_counts = None
+        self._bond_ring_counts = None
 
     def _initialize_ring_info(self):
         """RingInfo: Initialize ring information, catch if not available"""
@@ -343,6 +365,36 @@ class RingStack(object):
             ri = self.owner.mol.GetRingInfo()
             return ri
 
+    @property
+    def atom_ring_counts(self):
+        """list : Returns the number of rings containing each atom.
+
+        Equivalent to calling ``info.NumAtomRings`` for every atom
+        index, but computed once from the ring tuples.
+        """
+        if self._atom_ring_counts is None:
+            counts = [0] * self.owner.mol.GetNumAtoms()
+            for ring in self.atom_rings:
+                for aix in ring:
+                    counts[aix] += 1
+            self._atom_ring_counts = counts
+        return self._atom_ring_counts
+
+    @property
+    def bond_ring_counts(self):
+        """list : Returns the number of rings containing each bond.
+
+        Equivalent to calling ``info.NumBondRings`` for every bond
+        index, but computed once from the ring tuples.
+        """
+        if self._bond_ring_counts is None:
+            counts = [0] * self.owner.mol.GetNumBonds()
+            for ring in self.bond_rings:
+                for bix in ring:
+                    counts[bix] += 1
+            self._bond_ring_counts = counts
+        return self._bond_ring_counts
+
     @property
     def count(self):
         """int : Returns the number of rings in the stack."""
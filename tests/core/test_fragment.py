@@ -30,6 +30,20 @@ def test_murcko(mol):
     assert Chem.MolToSmiles(murcko) == canon('C1CCC(C2CC3CCCCC3C2)CC1')
 
 
+def test_murcko_from_smiles(mol):
+    smiles = Chem.MolToSmiles(mol)
+    murcko = get_murcko_scaffold_from_smiles(smiles)
+    assert Chem.MolToSmiles(murcko) == Chem.MolToSmiles(get_murcko_scaffold(mol))
+    generic = get_murcko_scaffold_from_smiles(smiles, generic=True)
+    assert Chem.MolToSmiles(generic) == Chem.MolToSmiles(get_murcko_scaffold(mol, generic=True))
+    # Cached scaffolds are returned as independent copies
+    assert get_murcko_scaffold_from_smiles(smiles) is not murcko
+    atomic_num = murcko.GetAtomWithIdx(0).GetAtomicNum()
+    murcko.GetAtomWithIdx(0).SetAtomicNum(0)
+    assert get_murcko_scaffold_from_smiles(smiles).GetAtomWithIdx(0).GetAtomicNum() == atomic_num
+    assert get_murcko_scaffold_from_smiles('not a smiles') is None
+
+
 def test_annotation(mol):
     annotation = Chem.MolToSmiles(get_annotated_murcko_scaffold(mol))
     annotation = annotation.replace('1*', '*')
@@ -45,6 +59,30 @@ def test_murcko_all(mol):
     assert len(frags) == 3
 
 
+def test_murcko_all_batch(mol):
+    benzene = Chem.MolFromSmiles('c1ccccc1')
+    batch = get_all_murcko_fragments_batch([mol, None, benzene], n_workers=2)
+    assert len(batch) == 3
+    expected = {Chem.MolToSmiles(x) for x in get_all_murcko_fragments(mol)}
+    assert {Chem.MolToSmiles(x) for x in batch[0]} == expected
+    assert batch[1] == []
+    assert [Chem.MolToSmiles(x) for x in batch[2]] == ['c1ccccc1']
+    batch = get_all_murcko_fragments_batch([mol], break_fused_rings=False, n_workers=1)
+    assert len(batch[0]) == 3
+
+
+@pytest.mark.parametrize('gil_enabled', [True, False])
+def test_murcko_all_threaded(monkeypatch, mol, gil_enabled):
+    import scaffoldgraph.core.fragment as fragment
+    monkeypatch.setattr(fragment, '_is_gil_enabled', lambda: gil_enabled)
+    results = get_all_murcko_fragments_threaded([mol, None, mol], n_threads=2)
+    assert len(results) == 3
+    expected = {Chem.MolToSmiles(x) for x in get_all_murcko_fragments(mol)}
+    assert {Chem.MolToSmiles(x) for x in results[0]} == expected
+    assert {Chem.MolToSmiles(x) for x in results[2]} == expected
+    assert results[1] == []
+
+
 def test_murcko_next(mol):
     scf = get_murcko_scaffold(mol)
     frags_1 = get_next_murcko_fragments(scf, break_fused_rings=True)
@@ -66,6 +104,23 @@ def test_collect_linker_atoms():
     a = collect_linker_atoms(mol.GetAtomWithIdx(0), remove_atoms, False)
     assert len(a) == 1
     assert len(remove_atoms) == 8
+    # Long linkers should not hit the recursion limit
+    mol = Chem.MolFromSmiles('c1ccccc1{}c1ccccc1'.format('C' * 2000))
+    remove_atoms.clear()
+    a = collect_linker_atoms(mol.GetAtomWithIdx(5), remove_atoms, False)
+    assert a == {5, 2006}
+    assert len(remove_atoms) == 2000
+
+
+@pytest.mark.parametrize('batch', [True, False])
+def test_remove_atoms_and_bonds(monkeypatch, batch):
+    import scaffoldgraph.core.fragment as fragment
+    monkeypatch.setattr(fragment, '_HAS_BATCH_EDIT', batch)
+    edit = Chem.RWMol(Chem.MolFromSmiles('c1ccccc1CCC1CC1'))
+    remove_atoms_and_bonds(edit, {6, 7}, [(8, 9)])
+    assert edit.GetNumAtoms() == 9
+    assert edit.GetNumBonds() == 8
+    assert Chem.MolToSmiles(edit) == canon('CCC.c1ccccc1')
 
 
 def test_remove_exocylic_attachments(mol):
@@ -40,6 +40,22 @@ def test_smiles(scaffold):
     assert scaffold == scaffold.smiles
     assert str(scaffold) == scaffold.smiles
     assert hash(scaffold) == hash(scaffold.smiles)
+    assert scaffold != Scaffold(Chem.MolFromSmiles('c1ccccc1'))
+
+
+def test_hash_func(scaffold):
+    calls = []
+
+    def hash_func(mol):
+        calls.append(mol)
+        return str(mol.GetNumAtoms())
+
+    scaffold.hash_func = hash_func
+    assert scaffold.get_canonical_identifier() == '19'
+    assert hash(scaffold) == hash('19')
+    assert len(calls) == 1
+    scaffold.hash_func = None
+    assert scaffold.get_canonical_identifier() == scaffold.smiles
 
 
 def test_name(scaffold):
@@ -93,6 +109,15 @@ def test_rings(scaffold):
     assert subset[0] != subset[1]
 
 
+def test_ring_counts(scaffold):
+    rings = scaffold.rings
+    atom_counts = [rings.info.NumAtomRings(a.GetIdx()) for a in scaffold.atoms]
+    bond_counts = [rings.info.NumBondRings(b.GetIdx()) for b in scaffold.bonds]
+    assert rings.atom_ring_counts == atom_counts
+    assert rings.bond_ring_counts == bond_counts
+    assert max(rings.atom_ring_counts) == 2
+
+
 def test_ring_systems(scaffold):
     rings = scaffold.ring_systems
     assert isinstance(rings, RingSystemStack)